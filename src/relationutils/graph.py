@@ -2,6 +2,7 @@ from typing import Any, Dict, List, Set, Tuple, Optional
 from relationutils.relation import Relation
 from relationutils.matrix import Matrix
 from collections import defaultdict, deque
+import numpy as np
 
 class Graph:
     """Implementación de grafos dirigidos y no dirigidos para análisis estructural.
@@ -39,9 +40,18 @@ class Graph:
         self.edges: List[Tuple[Any, Any, Optional[Any]]] = []  # a, b, etiqueta
         self.directed = directed
         self.relation: Optional[Relation] = None
+        self._adj: Optional[Dict[Any, List[Any]]] = None
+        self._relDirty = True
+        self._indeg: Dict[Any, int] = defaultdict(int)
+        self._outdeg: Dict[Any, int] = defaultdict(int)
+        self._seenPairs: Set[Tuple[Any, Any]] = set()
+        self._hasLoops = False
+        self._hasMulti = False
 
     def addNode(self, node: Any):
         self.nodes.add(node)
+        self._adj = None
+        self._relDirty = True
 
     def addEdge(self, a: Any, b: Any, label: Any = None):
         """Añade una arista entre dos nodos.
@@ -62,25 +72,57 @@ class Graph:
         """
         self.nodes.update([a, b])
         self.edges.append((a, b, label))
+        self._recordEdge(a, b)
         if not self.directed:
             self.edges.append((b, a, label))
+            self._recordEdge(b, a)
+        self._adj = None
+        self._relDirty = True
+
+    def _recordEdge(self, a: Any, b: Any):
+        """Actualiza los contadores incrementales de grados y multiaristas."""
+        self._outdeg[a] += 1
+        self._indeg[b] += 1
+        if a == b:
+            self._hasLoops = True
+        if (a, b) in self._seenPairs:
+            self._hasMulti = True
+        self._seenPairs.add((a, b))
+
+    def _rebuildEdgeStats(self):
+        """Reconstruye los contadores de grados tras reemplazar la lista de aristas."""
+        self._indeg = defaultdict(int)
+        self._outdeg = defaultdict(int)
+        self._seenPairs = set()
+        self._hasLoops = False
+        self._hasMulti = False
+        for a, b, _ in self.edges:
+            self._recordEdge(a, b)
 
     def buildRelation(self):
+        if not self._relDirty and self.relation is not None and self._adj is not None:
+            return
         pure_edges = [(a, b) for a, b, _ in self.edges]
         self.relation = Relation(list(self.nodes), pure_edges)
+        self._buildAdj()
+        self._relDirty = False
+
+    def _buildAdj(self):
+        """Construye la lista de adyacencia cacheada en un solo recorrido de aristas."""
+        adj: Dict[Any, List[Any]] = {}
+        for a, b, _ in self.edges:
+            adj.setdefault(a, []).append(b)
+        self._adj = adj
 
-    def getNeighbors(self, node: Any) -> Set[Any]:
-        if not self.relation:
-            self.buildRelation()
-        return self.relation.getFollowers(node)
+    def getNeighbors(self, node: Any) -> List[Any]:
+        if self._adj is None:
+            self._buildAdj()
+        return self._adj.get(node, [])
 
     def getEndpoints(self) -> Tuple[Any, Any]:
         """Retorna un nodo con grado impar de entrada/salida para caminos Eulerianos abiertos."""
-        indeg, outdeg = defaultdict(int), defaultdict(int)
-        for a, b, _ in self.edges:
-            outdeg[a] += 1
-            indeg[b] += 1
-        endpoints = [n for n in self.nodes if abs(indeg[n] - outdeg[n]) == 1]
+        endpoints = [n for n in self.nodes
+                     if abs(self._indeg[n] - self._outdeg[n]) == 1]
         return tuple(endpoints) if len(endpoints) == 2 else (None, None)
 
     def findEulerianPath(self) -> Optional[List[Any]]:
@@ -113,25 +155,35 @@ class Graph:
         else:
             start = next(iter(self.nodes))
 
-        temp_edges = self.edges.copy()
-        graph = defaultdict(list)
-        for a, b, _ in temp_edges:
-            graph[a].append(b)
+        # Adyacencia con cursores por vértice: "consumir" una arista es
+        # avanzar el índice, sin list.pop() por arista.
+        adj: Dict[Any, List[Any]] = {}
+        for a, b, _ in self.edges:
+            adj.setdefault(a, []).append(b)
+        head = {v: 0 for v in adj}
 
-        path, stack = [], [start]
+        path: List[Any] = [None] * (len(self.edges) + 1)
+        write = len(path)
+        stack = [start]
         while stack:
             v = stack[-1]
-            if graph[v]:
-                u = graph[v].pop()
+            nbrs = adj.get(v)
+            if nbrs is not None and head[v] < len(nbrs):
+                u = nbrs[head[v]]
+                head[v] += 1
                 stack.append(u)
             else:
-                path.append(stack.pop())
-        return path[::-1]
+                write -= 1
+                path[write] = stack.pop()
+        return path[write:]
 
     def fromRelation(self, relation: Relation):
         self.nodes = set(relation.A)
         self.edges = [(a, b, None) for a, b in relation.toPairs()]
         self.relation = relation
+        self._buildAdj()
+        self._rebuildEdgeStats()
+        self._relDirty = False
 
     def toRelation(self) -> Relation:
         self.buildRelation()
@@ -139,12 +191,12 @@ class Graph:
 
     def fromMatrix(self, matrix: Matrix, labels: List[Any]):
         self.nodes = set(labels)
-        self.edges.clear()
         data = matrix.toNumpy()
-        for i, a in enumerate(labels):
-            for j, b in enumerate(labels):
-                if data[i][j]:
-                    self.edges.append((a, b, None))
+        rows, cols = np.nonzero(data)
+        self.edges = [(labels[i], labels[j], None)
+                      for i, j in zip(rows.tolist(), cols.tolist())]
+        self._rebuildEdgeStats()
+        self._relDirty = True
         self.buildRelation()
 
     def toMatrix(self) -> Matrix:
@@ -153,37 +205,91 @@ class Graph:
 
     # Métodos existentes
     def isConnected(self) -> bool:
-        if not self.relation:
-            self.buildRelation()
-        closure = Relation(self.relation.A, list(self.relation.R))
-        closure.transitiveClosure()
-        return all((a, b) in closure.R for a in self.nodes for b in self.nodes)
+        """Verifica si el grafo es conexo mediante recorridos BFS.
 
-    def hasCycle(self) -> bool:
-        visited = set()
-
-        def dfs(v, path):
-            visited.add(v)
-            path.add(v)
-            for neighbor in self.getNeighbors(v):
-                if neighbor in path or (neighbor not in visited and dfs(neighbor, path)):
-                    return True
-            path.remove(v)
+        Returns:
+            bool: True si todo nodo es alcanzable desde todo otro nodo
+            (conexidad fuerte en grafos dirigidos).
+        """
+        if not self.nodes:
+            return True
+        if self._adj is None:
+            self._buildAdj()
+        start = next(iter(self.nodes))
+        if not self._bfsCoversAll(start, self._adj):
             return False
+        if not self.directed:
+            return True
+        radj: Dict[Any, List[Any]] = {}
+        for a, b, _ in self.edges:
+            radj.setdefault(b, []).append(a)
+        return self._bfsCoversAll(start, radj)
+
+    def _bfsCoversAll(self, start: Any, adj: Dict[Any, List[Any]]) -> bool:
+        """BFS desde start sobre la adyacencia dada; True si alcanza todos los nodos."""
+        visited = {start}
+        queue = deque([start])
+        while queue:
+            v = queue.popleft()
+            for u in adj.get(v, []):
+                if u not in visited:
+                    visited.add(u)
+                    queue.append(u)
+        return len(visited) == len(self.nodes)
 
-        return any(dfs(v, set()) for v in self.nodes if v not in visited)
+    def hasCycle(self) -> bool:
+        if self._adj is None:
+            self._buildAdj()
+        # Tricoloreado DFS: 0/ausente = sin visitar, 1 = en la pila, 2 = terminado.
+        color: Dict[Any, int] = {}
+        for root in self.nodes:
+            if root in color:
+                continue
+            color[root] = 1
+            stack = [(root, iter(self._adj.get(root, [])))]
+            while stack:
+                v, neighbors = stack[-1]
+                advanced = False
+                for u in neighbors:
+                    c = color.get(u, 0)
+                    if c == 1:
+                        return True
+                    if c == 0:
+                        color[u] = 1
+                        stack.append((u, iter(self._adj.get(u, []))))
+                        advanced = True
+                        break
+                if not advanced:
+                    color[v] = 2
+                    stack.pop()
+        return False
 
     def findPath(self, start: Any, end: Any, visited=None) -> Optional[List[Any]]:
         if visited is None:
             visited = set()
+        if self._adj is None:
+            self._buildAdj()
         visited.add(start)
+        path = [start]
         if start == end:
-            return [start]
-        for neighbor in self.getNeighbors(start):
-            if neighbor not in visited:
-                path = self.findPath(neighbor, end, visited)
-                if path:
-                    return [start] + path
+            return path
+        stack = [iter(self._adj.get(start, []))]
+        while stack:
+            neighbors = stack[-1]
+            advanced = False
+            for u in neighbors:
+                if u in visited:
+                    continue
+                visited.add(u)
+                path.append(u)
+                if u == end:
+                    return path
+                stack.append(iter(self._adj.get(u, [])))
+                advanced = True
+                break
+            if not advanced:
+                stack.pop()
+                path.pop()
         return None
 
     def findSimplePath(self, start: Any, end: Any, path=None) -> Optional[List[Any]]:
@@ -191,47 +297,90 @@ class Graph:
             path = [start]
         if start == end:
             return path
-        for neighbor in self.getNeighbors(start):
-            if neighbor not in path:
-                new_path = self.findSimplePath(neighbor, end, path + [neighbor])
-                if new_path:
-                    return new_path
+        if self._adj is None:
+            self._buildAdj()
+        onpath = set(path)
+        stack = [iter(self._adj.get(start, []))]
+        while stack:
+            neighbors = stack[-1]
+            advanced = False
+            for u in neighbors:
+                if u in onpath:
+                    continue
+                path.append(u)
+                onpath.add(u)
+                if u == end:
+                    return path
+                stack.append(iter(self._adj.get(u, [])))
+                advanced = True
+                break
+            if not advanced:
+                stack.pop()
+                if stack:
+                    onpath.discard(path.pop())
         return None
 
     def isEulerianCycle(self) -> bool:
         if not self.isConnected():
             return False
-        degree = defaultdict(int)
-        for a, b, _ in self.edges:
-            degree[a] += 1
-            if not self.directed:
-                degree[b] += 1
         if self.directed:
-            indeg = defaultdict(int)
-            outdeg = defaultdict(int)
-            for a, b, _ in self.edges:
-                outdeg[a] += 1
-                indeg[b] += 1
-            return all(indeg[n] == outdeg[n] for n in self.nodes)
-        else:
-            return all(degree[n] % 2 == 0 for n in self.nodes)
+            return all(self._indeg[n] == self._outdeg[n] for n in self.nodes)
+        # En grafos no dirigidos cada arista incidente aparece una vez en _outdeg.
+        return all(self._outdeg[n] % 2 == 0 for n in self.nodes)
 
     def getComponents(self) -> List[Set[Any]]:
-        visited = set()
-        components = []
+        """Calcula las componentes fuertemente conexas del grafo (Kosaraju iterativo).
 
-        def dfs(v, group):
-            group.add(v)
-            visited.add(v)
-            for u in self.getNeighbors(v):
-                if u not in visited:
-                    dfs(u, group)
+        Returns:
+            List[Set[Any]]: Una lista de conjuntos de nodos, uno por componente.
+
+        Note:
+            En grafos no dirigidos (aristas duplicadas en ambos sentidos)
+            coincide con las componentes conexas ordinarias.
+        """
+        if self._adj is None:
+            self._buildAdj()
+        radj: Dict[Any, List[Any]] = {}
+        for a, b, _ in self.edges:
+            radj.setdefault(b, []).append(a)
 
+        # Primera pasada: orden de finalización con DFS iterativa.
+        order, visited = [], set()
         for node in self.nodes:
-            if node not in visited:
-                group = set()
-                dfs(node, group)
-                components.append(group)
+            if node in visited:
+                continue
+            visited.add(node)
+            stack = [(node, iter(self._adj.get(node, [])))]
+            while stack:
+                v, neighbors = stack[-1]
+                advanced = False
+                for u in neighbors:
+                    if u not in visited:
+                        visited.add(u)
+                        stack.append((u, iter(self._adj.get(u, []))))
+                        advanced = True
+                        break
+                if not advanced:
+                    order.append(v)
+                    stack.pop()
+
+        # Segunda pasada: recorrido del grafo inverso en orden inverso.
+        components = []
+        seen = set()
+        for node in reversed(order):
+            if node in seen:
+                continue
+            seen.add(node)
+            group = {node}
+            stack = [node]
+            while stack:
+                v = stack.pop()
+                for u in radj.get(v, []):
+                    if u not in seen:
+                        seen.add(u)
+                        group.add(u)
+                        stack.append(u)
+            components.append(group)
         return components
 
     def getGraphType(self) -> str:
@@ -240,18 +389,9 @@ class Graph:
             type_info.append("Dirigido")
         else:
             type_info.append("No Dirigido")
-        seen = set()
-        has_multiedges = False
-        has_loops = False
-        for a, b, _ in self.edges:
-            if (a, b) in seen:
-                has_multiedges = True
-            seen.add((a, b))
-            if a == b:
-                has_loops = True
-        if has_multiedges:
+        if self._hasMulti:
             type_info.append("Multigrafo")
-        if has_loops:
+        if self._hasLoops:
             type_info.append("Pseudografo")
         return ", ".join(type_info)
 
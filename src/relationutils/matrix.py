@@ -1,6 +1,25 @@
 import numpy as np
 from typing import Union, List
 
+try:
+    from numba import njit
+except ImportError:  # numba es opcional; sin él se usa la ruta de bitsets
+    njit = None
+
+if njit is not None:
+    @njit(cache=True)
+    def _warshallNumba(m):  # pragma: no cover
+        """Warshall clásico in-place sobre una matriz uint8 contigua."""
+        n = m.shape[0]
+        for k in range(n):
+            for i in range(n):
+                if m[i, k]:
+                    for j in range(n):
+                        if m[k, j]:
+                            m[i, j] = 1
+else:
+    _warshallNumba = None
+
 class Matrix:
     """Representación algebraica de matrices booleanas para teoría de relaciones.
 
@@ -28,9 +47,9 @@ class Matrix:
                 Matriz inicial (np.array o listas de listas).
         """
         if isinstance(data, np.ndarray):
-            self._matrix = data.astype(int)
+            self._matrix = data.astype(np.int8)
         else:
-            self._matrix = np.array(data, dtype=int)
+            self._matrix = np.array(data, dtype=np.int8)
         self.shape = self._matrix.shape
 
     def __str__(self) -> str:
@@ -38,12 +57,12 @@ class Matrix:
         return str(self._matrix)
 
     def __add__(self, other: 'Matrix') -> 'Matrix':
-        """Suma elemento a elemento de dos matrices."""
-        return Matrix(self._matrix + other._matrix)
+        """Unión booleana (OR elemento a elemento) de dos matrices."""
+        return Matrix(np.logical_or(self._matrix, other._matrix))
 
     def __matmul__(self, other: 'Matrix') -> 'Matrix':
-        """Multiplicación matricial (usando el operador @)."""
-        return Matrix(self._matrix @ other._matrix)
+        """Producto matricial booleano (OR de ANDs, usando el operador @)."""
+        return Matrix(self._matrix.astype(bool) @ other._matrix.astype(bool))
 
     def __mul__(self, other: Union['Matrix', int]) -> 'Matrix':
         """
@@ -79,21 +98,18 @@ class Matrix:
         np.fill_diagonal(closure, 1)
         return Matrix(closure)
 
-    def transitiveClosure(self, maxIter: int = 1000) -> 'Matrix':
+    def transitiveClosure(self) -> 'Matrix':
         """Calcula la clausura transitiva usando el algoritmo de Warshall.
 
-        Args:
-            maxIter: Límite de iteraciones para prevenir no convergencia.
-
         Returns:
             Nueva Matrix que representa la clausura transitiva.
 
-        Raises:
-            Exception: Si no converge en maxIter iteraciones.
-
         Note:
-            Complejidad computacional: O(n³) donde n es el tamaño de la matriz.
-            Usa multiplicación matricial booleana para eficiencia.
+            Con numba instalado usa un triple bucle Warshall compilado
+            (@njit) sin asignaciones intermedias. En caso contrario
+            trabaja sobre filas empaquetadas en bitsets uint64 (64
+            columnas por palabra): O(n³/64) con 64 veces menos tráfico
+            de memoria que la multiplicación matricial entera iterada.
 
         Example:
             >>> m = Matrix([[1, 1, 0], [0, 1, 0], [0, 0, 1]])
@@ -102,14 +118,26 @@ class Matrix:
                    [0, 1, 0],
                    [0, 0, 1]])
         """
-        P_R = self._matrix.copy()
-        closure = self._matrix.copy()
-        for i in range(maxIter):
-            lastClosure = closure.copy()
-            closure = ((closure @ P_R) + closure).astype(bool).astype(int)
-            if np.array_equal(closure, lastClosure):
-                return Matrix(closure)
-        raise Exception("No converge: max iterations reached")
+        n = self.shape[0]
+        if n == 0:
+            return Matrix(self._matrix.copy())
+        if _warshallNumba is not None:
+            m = np.ascontiguousarray((self._matrix != 0).astype(np.uint8))
+            _warshallNumba(m)
+            return Matrix(m)
+        # Empaqueta cada fila en palabras uint64 (rellenando a múltiplo de 64 bits).
+        packed = np.packbits(self._matrix != 0, axis=1, bitorder='little')
+        words = (n + 63) // 64
+        bits = np.zeros((n, words * 8), dtype=np.uint8)
+        bits[:, :packed.shape[1]] = packed
+        bits = bits.view(np.uint64)
+        # Warshall: OR de la fila k sobre todas las filas que alcanzan k.
+        for k in range(n):
+            reaches_k = (bits[:, k >> 6] >> np.uint64(k & 63)) & np.uint64(1)
+            rows = np.nonzero(reaches_k)[0]
+            bits[rows] |= bits[k]
+        unpacked = np.unpackbits(bits.view(np.uint8), axis=1, bitorder='little')
+        return Matrix(unpacked[:, :n])
 
     def fromRelation(self, relation: List[tuple]) -> 'Matrix':
         """
@@ -121,9 +149,10 @@ class Matrix:
         Returns:
             Matrix: Referencia a sí mismo (para encadenar).
         """
-        self._matrix = np.zeros((self.shape[0], self.shape[1]), dtype=int)
-        for i, j in relation:
-            self._matrix[i, j] = 1
+        self._matrix = np.zeros((self.shape[0], self.shape[1]), dtype=np.int8)
+        if relation:
+            rel_arr = np.asarray(relation, dtype=np.intp)
+            self._matrix[rel_arr[:, 0], rel_arr[:, 1]] = 1
         return self
 
     def toRelation(self) -> List[tuple]:
@@ -133,12 +162,13 @@ class Matrix:
         Returns:
             List[tuple]: Lista de relaciones activas.
         """
-        return [(i, j) for i in range(self.shape[0]) for j in range(self.shape[1]) if self._matrix[i, j] == 1]
+        idx = np.argwhere(self._matrix)
+        return [(int(i), int(j)) for i, j in idx]
 
     @staticmethod
     def identity(size: int) -> 'Matrix':
         """Crea una matriz identidad de tamaño dado."""
-        return Matrix(np.identity(size, dtype=int))
+        return Matrix(np.identity(size, dtype=np.int8))
 
     @staticmethod
     def zero(rows: int, cols: int = None) -> 'Matrix':
@@ -154,7 +184,7 @@ class Matrix:
         """
         if cols is None:
             cols = rows
-        return Matrix(np.zeros((rows, cols), dtype=int))
+        return Matrix(np.zeros((rows, cols), dtype=np.int8))
 
     def isSymmetric(self) -> bool:
         """Verifica si la matriz es simétrica."""
@@ -1,5 +1,6 @@
 from typing import List, Tuple, Union, Any, Dict, Set
 from relationutils.matrix import Matrix
+import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib_venn as venn
 
@@ -15,8 +16,8 @@ class Relation:
     Attributes:
         A (List[Any]): Dominio de la relación.
         B (List[Any]): Codominio (igual a A para relaciones homogéneas).
-        R (Set[Tuple[Any, Any]]): Conjunto de pares de la relación.
-        matrix (Matrix): Representación matricial.
+        R (Set[Tuple[Any, Any]]): Conjunto de pares, derivado de la matriz.
+        matrix (Matrix): Representación matricial (fuente de verdad).
 
     Example:
         >>> rel = Relation(['a', 'b'], [('a', 'b')])
@@ -38,11 +39,33 @@ class Relation:
         self.A = elements
         self.B = elements  # Para relaciones homogéneas A x A
         self.indexMap: Dict[Any, int] = {elem: idx for idx, elem in enumerate(elements)}
-        self.reverseMap: Dict[int, Any] = {idx: elem for idx, elem in enumerate(elements)}
-        self.R: Set[Tuple[Any, Any]] = set()
+        # self.A ya mapea índice -> elemento; _rev es su copia indexable por numpy.
+        self._rev = np.empty(len(elements), dtype=object)
+        self._rev[:] = elements
+        self._followers: Dict[Any, Set[Any]] = {}
+        self._parents: Dict[Any, Set[Any]] = {}
         self.matrix = Matrix.zero(len(elements))
         if pairs:
-            self.addPairs(pairs)
+            imap = self.indexMap
+            ia = np.fromiter((imap[a] for a, _ in pairs),
+                             dtype=np.intp, count=len(pairs))
+            ib = np.fromiter((imap[b] for _, b in pairs),
+                             dtype=np.intp, count=len(pairs))
+            self.matrix._matrix[ia, ib] = 1
+            for a, b in pairs:
+                self._followers.setdefault(a, set()).add(b)
+                self._parents.setdefault(b, set()).add(a)
+
+    @property
+    def R(self) -> Set[Tuple[Any, Any]]:
+        """
+        Conjunto de pares de la relación, materializado desde la matriz.
+
+        Returns:
+            Set[Tuple[Any, Any]]: Pares (a, b) con entrada 1 en la matriz.
+        """
+        ij = np.argwhere(self.matrix.toNumpy())
+        return set(zip(self._rev[ij[:, 0]].tolist(), self._rev[ij[:, 1]].tolist()))
 
     def __getitem__(self, x: Any) -> Set[Any]:
         """
@@ -88,7 +111,8 @@ class Relation:
             Relation: La instancia actual para encadenamiento.
         """
         a, b = pair
-        self.R.add((a, b))
+        self._followers.setdefault(a, set()).add(b)
+        self._parents.setdefault(b, set()).add(a)
         i, j = self.indexMap[a], self.indexMap[b]
         self.matrix._matrix[i, j] = 1
         return self
@@ -103,6 +127,19 @@ class Relation:
         for pair in pairs:
             self.addPair(pair)
 
+    def _rebuildIndices(self):
+        """
+        Reconstruye los índices de seguidores y padres desde la matriz.
+
+        Se invoca tras operaciones que reemplazan la matriz en bloque (clausuras).
+        """
+        self._followers = {}
+        self._parents = {}
+        rev = self._rev
+        for i, j in np.argwhere(self.matrix.toNumpy()).tolist():
+            self._followers.setdefault(rev[i], set()).add(rev[j])
+            self._parents.setdefault(rev[j], set()).add(rev[i])
+
     def toPairs(self) -> List[Tuple[Any, Any]]:
         """
         Devuelve la relación como lista de pares.
@@ -118,38 +155,15 @@ class Relation:
         """
         self.matrix = self.matrix.reflexiveClosure()
         for e in self.A:
-            self.R.add((e, e))
+            self._followers.setdefault(e, set()).add(e)
+            self._parents.setdefault(e, set()).add(e)
 
     def transitiveClosure(self):
-        """Representación matemática de relaciones binarias con operaciones de análisis.
-
-        Implementa relaciones sobre conjuntos finitos con:
-        - Representación matricial y por pares
-        - Operaciones de clausura
-        - Verificación de propiedades algebraicas
-        - Visualización gráfica
-
-        Attributes:
-            A (List[Any]): Dominio de la relación.
-            B (List[Any]): Codominio (igual a A para relaciones homogéneas).
-            R (Set[Tuple[Any, Any]]): Conjunto de pares de la relación.
-            matrix (Matrix): Representación matricial.
-
-        Example:
-            >>> rel = Relation(['a', 'b'], [('a', 'b')])
-            >>> rel.isReflexive()
-            False
-            >>> rel.reflexiveClosure()
-            >>> rel.isReflexive()
-            True
+        """
+        Aplica la clausura transitiva: ∀(a, b), (b, c) ∈ R, se asegura que (a, c) ∈ R.
         """
         self.matrix = self.matrix.transitiveClosure()
-        newR = set()
-        for i, row in enumerate(self.matrix.toNumpy()):
-            for j, val in enumerate(row):
-                if val:
-                    newR.add((self.reverseMap[i], self.reverseMap[j]))
-        self.R = newR
+        self._rebuildIndices()
 
     def isSymmetric(self) -> bool:
         """
@@ -158,7 +172,7 @@ class Relation:
         Returns:
             bool: True si la relación es simétrica.
         """
-        return all((b, a) in self.R for (a, b) in self.R)
+        return self.matrix.isSymmetric()
 
     def isReflexive(self) -> bool:
         """
@@ -167,7 +181,7 @@ class Relation:
         Returns:
             bool: True si la relación es reflexiva.
         """
-        return all((a, a) in self.R for a in self.A)
+        return bool(self.matrix.isReflexive())
 
     def isTransitive(self) -> bool:
         """
@@ -176,11 +190,8 @@ class Relation:
         Returns:
             bool: True si la relación es transitiva.
         """
-        for a, b in self.R:
-            for c, d in self.R:
-                if b == c and (a, d) not in self.R:
-                    return False
-        return True
+        M = self.matrix.toNumpy().astype(bool)
+        return bool(np.all((M @ M) <= M))
 
     def isFunction(self) -> bool:
         """
@@ -190,12 +201,7 @@ class Relation:
         Returns:
             bool: True si es una función.
         """
-        seen = dict()
-        for a, b in self.R:
-            if a in seen and seen[a] != b:
-                return False
-            seen[a] = b
-        return True
+        return bool(np.all(self.matrix.toNumpy().sum(axis=1) <= 1))
 
     def getFollowers(self, a: Any) -> Set[Any]:
         """
@@ -207,7 +213,7 @@ class Relation:
         Returns:
             Set[Any]: Seguidores de 'a'.
         """
-        return {b for (x, b) in self.R if x == a}
+        return self._followers.get(a, set())
 
     def getParents(self, b: Any) -> Set[Any]:
         """
@@ -219,7 +225,7 @@ class Relation:
         Returns:
             Set[Any]: Padres de 'b'.
         """
-        return {a for (a, y) in self.R if y == b}
+        return self._parents.get(b, set())
 
     def getSiblings(self, a: Any) -> Set[Any]:
         """
@@ -231,10 +237,9 @@ class Relation:
         Returns:
             Set[Any]: Hermanos de 'a'.
         """
-        parents = self.getParents(a)
-        siblings = set()
-        for p in parents:
-            siblings.update(self.getFollowers(p))
+        siblings: Set[Any] = set()
+        for p in self._parents.get(a, ()):
+            siblings.update(self._followers[p])
         siblings.discard(a)
         return siblings
 
@@ -249,7 +254,9 @@ class Relation:
         Returns:
             bool: True si comparten descendencia.
         """
-        return len(self.getFollowers(a) & self.getFollowers(b) - {a, b}) > 0
+        fa = self._followers.get(a)
+        fb = self._followers.get(b)
+        return bool(fa and fb) and not fa.isdisjoint(fb)
 
     def areSiblings(self, a: Any, b: Any) -> bool:
         """
@@ -262,7 +269,9 @@ class Relation:
         Returns:
             bool: True si tienen padre(s) en común.
         """
-        return len(self.getParents(a) & self.getParents(b) - {a, b}) > 0
+        pa = self._parents.get(a)
+        pb = self._parents.get(b)
+        return bool(pa and pb) and not pa.isdisjoint(pb)
 
     def show(self):
         """
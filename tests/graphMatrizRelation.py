@@ -20,9 +20,9 @@ def test_integrated_operations():
     ]
     m = Matrix(data)
     
-    # Operaciones básicas
+    # Operaciones básicas (la suma es unión booleana)
     m2 = Matrix.identity(3)
-    assert (m + m2).toNumpy().tolist() == [[2, 0, 1], [0, 1, 1], [0, 1, 1]]
+    assert (m + m2).toNumpy().tolist() == [[1, 0, 1], [0, 1, 1], [0, 1, 1]]
     
     # Multiplicación matricial
     result = (m @ m).toNumpy().tolist()